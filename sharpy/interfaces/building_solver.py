@@ -1,10 +1,16 @@
 from abc import abstractmethod, ABC
 from typing import List, Optional
 
+from scipy.spatial.ckdtree import cKDTree
+
 from sc2.position import Point2
 
 
 class IBuildingSolver(ABC):
+    @abstractmethod
+    def structure_tree(self) -> Optional[cKDTree]:
+        pass
+
     @property
     @abstractmethod
     def zealot(self) -> Optional[Point2]:
@@ -1,7 +1,7 @@
 import logging
 import string
 from configparser import ConfigParser
-from typing import List, Optional, Callable, Type, Union
+from typing import Dict, List, Optional, Callable, Type, Union
 
 from sc2.data import Race, Result
 from sharpy.events import UnitDestroyedEvent
@@ -18,6 +18,7 @@ from sharpy.interfaces import (
     IPreviousUnitsManager,
 )
 from sc2.constants import *
+from sc2.game_data import Cost
 from sc2.position import Point2
 from typing import TYPE_CHECKING, TypeVar
 
@@ -48,6 +49,8 @@ class Knowledge:
         self.iteration: int = 0
         self.reserved_minerals: int = 0
         self.reserved_gas: int = 0
+        # Costs are static over a match, cache them instead of re-reading game data per call
+        self._cost_cache: Dict[Union[UnitTypeId, UpgradeId, AbilityId], Cost] = dict()
         self.log_manager: ILogManager = LogManager()
         # TODO: Remove references to these managers
         self.lag_handler: Optional[ILagHandler] = None
@@ -182,28 +185,30 @@ class Knowledge:
         self.reserved_minerals += minerals
         self.reserved_gas += gas
 
+    def calculate_cost(self, item_id: Union[UnitTypeId, UpgradeId, AbilityId]) -> Cost:
+        """ Cached version of game data cost calculation, the values never change during a match. """
+        cost = self._cost_cache.get(item_id)
+        if cost is None:
+            if isinstance(item_id, UnitTypeId):
+                unit = self.ai._game_data.units[item_id.value]
+                cost = self.ai._game_data.calculate_ability_cost(unit.creation_ability)
+            elif isinstance(item_id, UpgradeId):
+                cost = self.ai._game_data.upgrades[item_id.value].cost
+            else:
+                cost = self.ai._game_data.calculate_ability_cost(item_id)
+            self._cost_cache[item_id] = cost
+        return cost
+
     def reserve_costs(self, item_id: Union[UnitTypeId, UpgradeId, AbilityId]):
-        if isinstance(item_id, UnitTypeId):
-            unit = self.ai._game_data.units[item_id.value]
-            cost = self.ai._game_data.calculate_ability_cost(unit.creation_ability)
-        elif isinstance(item_id, UpgradeId):
-            cost = self.ai._game_data.upgrades[item_id.value].cost
-        else:
-            cost = self.ai._game_data.calculate_ability_cost(item_id)
+        cost = self.calculate_cost(item_id)
         self.reserve(cost.minerals, cost.vespene)
 
     def can_afford(self, item_id: Union[UnitTypeId, UpgradeId, AbilityId], check_supply_cost: bool = True) -> bool:
         """Tests if the player has enough resources to build a unit or cast an ability even after reservations."""
         enough_supply = True
-        if isinstance(item_id, UnitTypeId):
-            unit = self.ai._game_data.units[item_id.value]
-            cost = self.ai._game_data.calculate_ability_cost(unit.creation_ability)
-            if check_supply_cost:
-                enough_supply = self.ai.can_feed(item_id)
-        elif isinstance(item_id, UpgradeId):
-            cost = self.ai._game_data.upgrades[item_id.value].cost
-        else:
-            cost = self.ai._game_data.calculate_ability_cost(item_id)
+        cost = self.calculate_cost(item_id)
+        if check_supply_cost and isinstance(item_id, UnitTypeId):
+            enough_supply = self.ai.can_feed(item_id)
         minerals = self.ai.minerals - self.reserved_minerals
         gas = self.ai.vespene - self.reserved_gas
         return cost.minerals <= minerals and cost.vespene <= max(0, gas) and enough_supply
@@ -139,18 +139,20 @@ class ActionManager(ManagerBase):
     async def update(self):
         self.block_list.clear()
 
-        # Loop in reverse order in order to remove old actions properly
-        for i in range(0, len(self.actions))[::-1]:
-            action = self.actions[i]
+        # Single forward pass building a survivor list, popping mid list shifts the whole tail
+        alive_actions: List[ActionIssued] = []
+        for action in self.actions:
             # TODO: check if the unit in question has received the specified action.
             if action.is_old:
-                self.actions.pop(i)
-            else:
-                action_list = self.block_list.get(action.tag, None)
-                if action_list is None:
-                    action_list = []
-                    self.block_list[action.tag] = action_list
-                action_list.append(action)
+                continue
+            alive_actions.append(action)
+            action_list = self.block_list.get(action.tag, None)
+            if action_list is None:
+                action_list = []
+                self.block_list[action.tag] = action_list
+            action_list.append(action)
+
+        self.actions = alive_actions
 
     def attempt_action(self, action: UnitCommand) -> bool:
         unit = action.unit
@@ -5,6 +5,7 @@ from math import floor
 from typing import Dict, List, Optional, Tuple, Set
 
 import numpy as np
+from scipy.spatial.ckdtree import cKDTree
 
 import sc2pathlib
 from sc2.data import Race
@@ -164,6 +165,27 @@ class BuildingSolver(ManagerBase, IBuildingSolver):
         # TODO Don't queue new units in the structure if an addon swap is planned
         self.structure_target_move_location: Dict[int, Point2] = {}
 
+        # Shared structure position kd-tree, built lazily at most once per iteration
+        self._structure_tree: Optional[cKDTree] = None
+        self._structure_tree_iteration: int = -1
+
+    def structure_tree(self) -> Optional[cKDTree]:
+        """kd-tree over own structure positions for placement occupancy queries.
+
+        Shared by all GridBuilding instances so competing build orders don't each
+        rebuild the same tree on the same iteration. Returns None without structures."""
+        iteration = self.knowledge.iteration
+        if self._structure_tree_iteration != iteration:
+            structures = self.ai.structures
+            if structures:
+                self._structure_tree = cKDTree(
+                    np.array([(structure.position.x, structure.position.y) for structure in structures])
+                )
+            else:
+                self._structure_tree = None
+            self._structure_tree_iteration = iteration
+        return self._structure_tree
+
     @property
     def zealot(self) -> Optional[Point2]:
         return self._zealot
@@ -285,9 +307,11 @@ class BuildingSolver(ManagerBase, IBuildingSolver):
         zone_color = ZoneArea.OwnMainZone
         self.fill_zone(zone.center_location, zone_color)
 
-        if self.knowledge.my_race == Race.Terran:
-            list = self._building_positions.get(BuildArea.Building)
-            list.sort(key=lambda k: start.distance_to_point2(k))
+        # Sort 3x3 spots closest to main first so placement scans find a free slot early.
+        # 2x2 positions are not sorted, pylon pair order matters there.
+        building_list = self._building_positions.get(BuildArea.Building)
+        if building_list:
+            building_list.sort(key=lambda k: start.distance_to_point2(k))
 
         zone: Zone = self.zone_manager.expansion_zones[1]
         zone_color = ZoneArea.OwnNaturalZone
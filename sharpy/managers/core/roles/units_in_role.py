@@ -41,7 +41,7 @@ class UnitsInRole:
 
     def update(self):
         self.units.clear()
-        new_tags: Set[int] = set()
+        dead_tags: Set[int] = set()
 
         for tag in self.tags:
             unit = self.cache.by_tag(tag)
@@ -49,6 +49,8 @@ class UnitsInRole:
             if unit is not None and unit.is_mine:
                 # update unit to collection
                 self.units.append(unit)
-                new_tags.add(tag)
+            else:
+                dead_tags.add(tag)
 
-        self.tags = new_tags
+        if dead_tags:
+            self.tags -= dead_tags
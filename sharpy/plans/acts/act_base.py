@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import sc2
 from sc2.data import Race
@@ -87,6 +87,15 @@ class ActBase(Component, ABC):
         """ Only counts buildings that are commanded to be built, not ready builds are not included"""
         return self.get_count(unit_type) - self.get_count(unit_type, include_pending=False)
 
+    def get_count_and_pending(self, unit_type: UnitTypeId) -> Tuple[int, float]:
+        """Single pass version of get_count(include_pending=False, include_not_ready=True)
+        paired with the pending builds whose construction has not started yet.
+        Shares one unit cache lookup instead of the three the separate calls make."""
+        type_count = self.cache.own(unit_type)
+        count = self.related_count(type_count.amount, unit_type)
+        not_started = self.unit_pending_count(unit_type) - 2 * type_count.not_ready.amount
+        return count, not_started
+
     def pending_building_positions(self, unit_type: UnitTypeId) -> List[Point2]:
         """Returns positions of buildings of the specified type that have either been ordered to be built by a worker
         or are currently being built."""
@@ -0,0 +1,37 @@
+from abc import abstractmethod
+from math import ceil
+
+from sharpy.plans.acts import GridBuilding
+from sc2.ids.unit_typeid import UnitTypeId
+
+
+class AutoSupply(GridBuilding):
+    """Builds supply structures automatically when needed based on predicted supply growth speed."""
+
+    def __init__(self, unit_type: UnitTypeId, build_time: int):
+        super().__init__(unit_type, 0)
+        self.supply_build_time = build_time
+
+    async def execute(self):
+        self.to_count = await self.pylon_count_calc()
+        return await super().execute()
+
+    async def pylon_count_calc(self) -> int:
+        if self.ai.supply_cap == 200:
+            # Already at max supply, no point in predicting growth
+            return self.current_count()
+
+        growth_speed = self.growth_speed()
+        growth_speed *= 1.2  # Just a little bit of margin of error
+
+        predicted_supply = min(200, self.ai.supply_used + self.supply_build_time * growth_speed)
+
+        return ceil((predicted_supply - self.ai.supply_cap) / 8) + self.current_count()
+
+    @abstractmethod
+    def growth_speed(self) -> float:
+        """ Predicted supply usage per second based on ready production structures. """
+
+    @abstractmethod
+    def current_count(self) -> int:
+        """ Count of ready supply structures. """
@@ -1,5 +1,8 @@
 from math import floor
-from typing import Optional, Set
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy.spatial.ckdtree import cKDTree
 
 from sc2.data import Race
 from sc2.ids.ability_id import AbilityId
@@ -8,15 +11,41 @@ from sharpy.sc2math import to_new_ticks
 
 from sharpy.managers.core.roles import UnitTask
 from sharpy.utils import map_to_point2s_center
+from sc2.game_data import Cost
 from sc2.ids.unit_typeid import UnitTypeId
 from sc2.position import Point2
 from sc2.unit import Unit
+from sc2.units import Units
 
 from .act_building import ActBuilding
 from sharpy.interfaces import IBuildingSolver, IIncomeCalculator
 from sharpy.managers.core import PathingManager
 
 worker_trainers = {AbilityId.NEXUSTRAIN_PROBE, AbilityId.COMMANDCENTERTRAIN_SCV}
+move_abilities = {AbilityId.MOVE, AbilityId.MOVE_MOVE}
+
+# Structures that need to be completed before the key can be started.
+building_prerequisites = {
+    # Protoss
+    UnitTypeId.GATEWAY: (UnitTypeId.PYLON,),
+    UnitTypeId.FORGE: (UnitTypeId.PYLON,),
+    UnitTypeId.CYBERNETICSCORE: (UnitTypeId.GATEWAY, UnitTypeId.WARPGATE),
+    UnitTypeId.TWILIGHTCOUNCIL: (UnitTypeId.CYBERNETICSCORE,),
+    UnitTypeId.TEMPLARARCHIVE: (UnitTypeId.TWILIGHTCOUNCIL,),
+    UnitTypeId.DARKSHRINE: (UnitTypeId.TWILIGHTCOUNCIL,),
+    UnitTypeId.STARGATE: (UnitTypeId.CYBERNETICSCORE,),
+    UnitTypeId.FLEETBEACON: (UnitTypeId.STARGATE,),
+    UnitTypeId.ROBOTICSFACILITY: (UnitTypeId.CYBERNETICSCORE,),
+    UnitTypeId.ROBOTICSBAY: (UnitTypeId.ROBOTICSFACILITY,),
+    UnitTypeId.PHOTONCANNON: (UnitTypeId.FORGE,),
+    UnitTypeId.SHIELDBATTERY: (UnitTypeId.CYBERNETICSCORE,),
+    # Terran
+    UnitTypeId.BARRACKS: (UnitTypeId.SUPPLYDEPOT,),
+    UnitTypeId.FACTORY: (UnitTypeId.BARRACKS,),
+    UnitTypeId.ARMORY: (UnitTypeId.FACTORY,),
+    UnitTypeId.STARPORT: (UnitTypeId.FACTORY,),
+    UnitTypeId.FUSIONCORE: (UnitTypeId.STARPORT,),
+}
 
 
 class WorkerStuckStatus:
@@ -24,28 +53,38 @@ class WorkerStuckStatus:
         self.tag_stuck: Optional[int] = None
         self.last_move_detected_time: Optional[float] = None
         self.current_tag: Optional[int] = None
-        self.last_moved_position: Optional[Point2] = None
-        self.last_iteration_asked = 0
-
-    def need_new_worker(self, current_worker: Unit, time: float, target: Point2, iteration: int) -> bool:
-        if self.last_iteration_asked < iteration - 1:
+        # Stored as a plain (x, y) tuple, a full Point2 is never needed here
+        self.last_moved_position: Optional[Tuple[float, float]] = None
+        self.last_called_time: float = -10
+
+    @staticmethod
+    def _distance_squared(point: Tuple[float, float], position: Point2) -> float:
+        """ Squared distance, avoids the sqrt of distance_to in these per frame checks. """
+        dx = point[0] - position.x
+        dy = point[1] - position.y
+        return dx * dx + dy * dy
+
+    def need_new_worker(self, current_worker: Unit, time: float, target: Point2) -> bool:
+        # Game time based reset, iteration counts depend on step size and realtime lag
+        if time - self.last_called_time > 0.5:
+            self.last_called_time = time
             # reset
             self.tag_stuck = None
             self.current_tag = current_worker.tag
             self.last_move_detected_time = time
-            self.last_moved_position = current_worker.position
+            self.last_moved_position = (current_worker.position.x, current_worker.position.y)
             return False
 
-        self.last_iteration_asked = iteration
+        self.last_called_time = time
 
         if current_worker.tag == self.current_tag:
-            if target.distance_to_point2(current_worker.position) < 2.5:
+            if self._distance_squared((target.x, target.y), current_worker.position) < 6.25:  # 2.5 ** 2
                 return False  # Worker is close enough to destination, not stuck
             if self.last_moved_position is None:
-                self.last_moved_position = current_worker.position
-            elif self.last_moved_position.distance_to_point2(current_worker.position) > 0.5:
+                self.last_moved_position = (current_worker.position.x, current_worker.position.y)
+            elif self._distance_squared(self.last_moved_position, current_worker.position) > 0.25:  # 0.5 ** 2
                 self.last_move_detected_time = time
-                self.last_moved_position = current_worker.position
+                self.last_moved_position = (current_worker.position.x, current_worker.position.y)
             elif time - self.last_move_detected_time > 1:
                 self.tag_stuck = self.current_tag
                 return True
@@ -56,7 +95,7 @@ class WorkerStuckStatus:
         self.tag_stuck = None
         self.current_tag = current_worker.tag
         self.last_move_detected_time = time
-        self.last_moved_position = current_worker.position
+        self.last_moved_position = (current_worker.position.x, current_worker.position.y)
         return False
 
 
@@ -66,6 +105,8 @@ class GridBuilding(ActBuilding):
     income_calculator: IIncomeCalculator
     pather: Optional[PathingManager]
     last_iteration_moved: int
+    _position_fn: Callable[[int], Optional[Point2]]
+    _build_fn: Callable[[Unit, int, Point2], Awaitable]
 
     def __init__(
         self,
@@ -87,18 +128,48 @@ class GridBuilding(ActBuilding):
         self.make_pylon = None
         self.last_iteration_moved = -10
         self.worker_stuck: WorkerStuckStatus = WorkerStuckStatus()
+        self._zone_centers: Optional[List[Point2]] = None
+        self._cost: Cost = None
+        self._last_position: Optional[Point2] = None
+        self._last_position_sig: Optional[tuple] = None
+        self._wall3x3_set: Optional[frozenset] = None
+        self._slice_cache: dict = {}
+        self._slice_cache_source_len = -1
+        self._adjust_cache: dict = {}
+        self._array_cache: dict = {}
+        self._array_cache_source_len = -1
+        self._forbidden_cached: Optional[Set[Point2]] = None
+        self._forbidden_cached_iteration: int = -1
+        self._worker_speed_ticks: Optional[float] = None
 
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
         self.building_solver = self.knowledge.get_required_manager(IBuildingSolver)
         self.pather = self.knowledge.get_manager(PathingManager)
         self.income_calculator = self.knowledge.get_required_manager(IIncomeCalculator)
+        # Build cost never changes during a game
+        self._cost = knowledge.calculate_cost(self.unit_type)
+        if self.knowledge.my_race == Race.Protoss:
+            self._position_fn = self.position_protoss
+            self._build_fn = self.build_protoss
+        elif self.knowledge.my_race == Race.Terran:
+            self._position_fn = self.position_terran
+            self._build_fn = self.build_terran
+        else:
+            self._position_fn = self.position_zerg
+            self._build_fn = self.build_zerg
         if self.unit_type != UnitTypeId.PYLON:
             self.make_pylon: Optional[GridBuilding] = GridBuilding(UnitTypeId.PYLON, 0, 2)
             await self.make_pylon.start(knowledge)
 
     async def execute(self) -> bool:
-        count = self.get_count(self.unit_type, include_pending=False, include_not_ready=True)
+        # Bind frequently used attributes to locals, execute runs for every GridBuilding every iteration
+        knowledge = self.knowledge
+        ai = self.ai
+        unit_type = self.unit_type
+        iteration = knowledge.iteration
+
+        count, pending_not_started = self.get_count_and_pending(unit_type)
 
         if count >= self.to_count:
             if self.builder_tag is not None:
@@ -106,10 +177,7 @@ class GridBuilding(ActBuilding):
 
             return True  # Step is done
 
-        if (
-            count + (self.pending_build(self.unit_type) - self.cache.own(self.unit_type).not_ready.amount)
-            >= self.to_count
-        ):
+        if count + pending_not_started >= self.to_count:
             if self.builder_tag is not None:
                 worker = self.cache.by_tag(self.builder_tag)
                 if worker is not None:
@@ -117,19 +185,14 @@ class GridBuilding(ActBuilding):
                     await self.debug_draw()
             return True  # Building is ordered
 
-        if self.knowledge.my_race == Race.Protoss:
-            position = self.position_protoss(count)
-        elif self.knowledge.my_race == Race.Terran:
-            position = self.position_terran(count)
-        else:
-            position = self.position_zerg(count)
+        position = self._find_position(count)
 
         if position is None:
             if self.make_pylon is not None:
                 self.make_pylon.to_count = len(self.cache.own(UnitTypeId.PYLON).ready) + 1
                 await self.make_pylon.execute()
             else:
-                self.print(f"Can't find free position to build {self.unit_type.name} in!")
+                self.print(f"Can't find free position to build {unit_type.name} in!")
             return False  # Stuck and cannot proceed
 
         worker = self.get_worker_builder(position, self.builder_tag)  # type: Unit
@@ -138,7 +201,7 @@ class GridBuilding(ActBuilding):
             self.builder_tag = None
             return False  # Cannot proceed
 
-        if self.worker_stuck.need_new_worker(worker, self.ai.time, position, self.knowledge.iteration):
+        if self.worker_stuck.need_new_worker(worker, ai.time, position):
             self.print(f"Worker {worker.tag} was found stuck!")
             self.roles.set_task(UnitTask.Reserved, worker)  # Set temp reserved for the stuck worker.
             worker = self.get_worker_builder(position, None)
@@ -147,74 +210,132 @@ class GridBuilding(ActBuilding):
             self.set_worker(worker)
             return False
 
-        d = worker.distance_to(position)
-        time = d / to_new_ticks(worker.movement_speed)
-
-        if self.last_iteration_moved >= self.knowledge.iteration - 1:
-            # stop indecisiveness
-            time += 5
-
-        unit = self.ai._game_data.units[self.unit_type.value]
-        cost = self.ai._game_data.calculate_ability_cost(unit.creation_ability)
+        cost = self._cost
 
         wait_time = self.prequisite_progress()
 
-        adjusted_income = self.income_calculator.mineral_income * 0.93  # 14 / 15 = 0.933333
-
-        if self.knowledge.can_afford(self.unit_type, check_supply_cost=False):
+        # has_build_order(worker) was False above and no new orders have been issued since,
+        # no need to scan the worker orders again in the branches below.
+        # Travel time and income are only computed in the branches that actually use them.
+        if knowledge.can_afford(unit_type, check_supply_cost=False):
             if wait_time <= 0:
                 self.set_worker(worker)
-                if worker.tag not in self.ai.unit_tags_received_action and not self.has_build_order(worker):
+                if worker.tag not in ai.unit_tags_received_action:
                     # No duplicate builds
-                    if self.knowledge.my_race == Race.Protoss:
-                        await self.build_protoss(worker, count, position)
-                    elif self.knowledge.my_race == Race.Terran:
-                        await self.build_terran(worker, count, position)
-                    else:
-                        await self.build_zerg(worker, count, position)
+                    await self._build_fn(worker, count, position)
                 return False
 
-            if self.priority and wait_time < time:
-                # Go wait
-                self.set_worker(worker)
-                self.knowledge.reserve(cost.minerals, cost.vespene)
-                if not self.has_build_order(worker):
-                    worker.move(self.adjust_build_to_move(position))
-                    self.last_iteration_moved = self.knowledge.iteration
-
-        elif self.priority and wait_time < time:
-            available_minerals = self.ai.minerals - self.knowledge.reserved_minerals
-            available_gas = self.ai.vespene - self.knowledge.reserved_gas
-
-            if self.consider_worker_production and adjusted_income > 0:
-                for town_hall in self.ai.townhalls:  # type: Unit
-                    # TODO: Zerg(?)
-                    if town_hall.orders:
-                        starting_next_probe_in = -50 / adjusted_income
-                        order = town_hall.orders[0]  # Only consider first order
-                        if order.ability.id in worker_trainers:
-                            starting_next_probe_in += 12 * (1 - order.progress)
-
-                        if starting_next_probe_in < time:
+            if self.priority and wait_time < self._travel_time(worker, position, iteration):
+                self._go_wait(worker, position, iteration)
+
+        elif self.priority:
+            time = self._travel_time(worker, position, iteration)
+            if wait_time < time:
+                adjusted_income = self.income_calculator.mineral_income * 0.93  # 14 / 15 = 0.933333
+                available_minerals = ai.minerals - knowledge.reserved_minerals
+                available_gas = ai.vespene - knowledge.reserved_gas
+
+                if self.consider_worker_production and adjusted_income > 0:
+                    worker_payback_time = -50 / adjusted_income  # same for every town hall
+                    for town_hall in ai.townhalls:  # type: Unit
+                        # TODO: Zerg(?)
+                        if town_hall.orders:
+                            starting_next_probe_in = worker_payback_time
+                            order = town_hall.orders[0]  # Only consider first order
+                            if order.ability.id in worker_trainers:
+                                starting_next_probe_in += 12 * (1 - order.progress)
+
+                            if starting_next_probe_in < time:
+                                available_minerals -= 50  # should start producing workers soon now
+                        else:
                             available_minerals -= 50  # should start producing workers soon now
-                    else:
-                        available_minerals -= 50  # should start producing workers soon now
-
-            if (
-                available_minerals + time * adjusted_income >= cost.minerals
-                and available_gas + time * self.income_calculator.gas_income >= cost.vespene
-            ):
-                # Go wait
-                self.set_worker(worker)
-                self.knowledge.reserve(cost.minerals, cost.vespene)
 
-                if not self.has_build_order(worker):
-                    worker.move(self.adjust_build_to_move(position))
-                    self.last_iteration_moved = self.knowledge.iteration
+                if (
+                    available_minerals + time * adjusted_income >= cost.minerals
+                    and available_gas + time * self.income_calculator.gas_income >= cost.vespene
+                ):
+                    self._go_wait(worker, position, iteration)
 
         return False
 
+    def _go_wait(self, worker: Unit, position: Point2, iteration: int):
+        """ Reserve the build cost and send the worker to wait next to the build position. """
+        self.set_worker(worker)
+        cost = self._cost
+        self.knowledge.reserve(cost.minerals, cost.vespene)
+        move_target = self.adjust_build_to_move(position)
+        if not self._already_moving_to(worker, move_target):
+            worker.move(move_target)
+        self.last_iteration_moved = iteration
+
+    @staticmethod
+    def _already_moving_to(worker: Unit, target: Point2) -> bool:
+        """True when the worker's current order is already a move to roughly the target,
+        re-issuing the same move every iteration just spams actions."""
+        if not worker.orders:
+            return False
+        order = worker.orders[0]
+        if order.ability.id not in move_abilities:
+            return False
+        order_target = order.target
+        if not isinstance(order_target, Point2):
+            return False
+        dx = order_target.x - target.x
+        dy = order_target.y - target.y
+        return dx * dx + dy * dy < 0.25  # 0.5 ** 2
+
+    def _travel_time(self, worker: Unit, position: Point2, iteration: int) -> float:
+        """ Time in realtime seconds for the worker to reach the build position """
+        speed = self._worker_speed_ticks
+        if speed is None:
+            # Base worker movement speed never changes, convert it only once
+            speed = self._worker_speed_ticks = to_new_ticks(worker.movement_speed)
+        time = worker.distance_to(position) / speed
+        if self.last_iteration_moved >= iteration - 1:
+            # stop indecisiveness
+            time += 5
+        return time
+
+    def _find_position(self, count: int) -> Optional[Point2]:
+        """Finds a free position for the building, reusing the previous result when possible.
+
+        As long as a cheap state signature matches the last run, only the cached candidate is
+        revalidated instead of scanning the whole building grid again."""
+        sig = (count, self.ai.structures.amount, self.cache.own(UnitTypeId.PYLON).ready.amount)
+        if self._last_position is not None and sig == self._last_position_sig:
+            if self._position_still_valid(self._last_position):
+                return self._last_position
+
+        position = self._position_fn(count)
+        self._last_position = position
+        self._last_position_sig = sig
+        return position
+
+    def _position_still_valid(self, position: Point2) -> bool:
+        if self.ai.structures.closer_than(1, position):
+            return False
+        my_race = self.knowledge.my_race
+        if my_race == Race.Protoss and self.unit_type != UnitTypeId.PYLON:
+            if not self.ai.state.psionic_matrix.covers(position):
+                pylons = self.cache.own(UnitTypeId.PYLON).not_ready
+                return bool(pylons) and self._any_unit_within(pylons, position, 7)
+        elif my_race == Race.Terran and self.unit_type != UnitTypeId.SUPPLYDEPOT:
+            if position in self.building_solver.structure_target_move_location.values():
+                return False
+            if position in self.building_solver.free_addon_locations:
+                return False
+        elif my_race == Race.Zerg:
+            return self.is_on_creep(self.ai.state.creep, position)
+        return True
+
     def adjust_build_to_move(self, position: Point2) -> Point2:
+        # Build positions are discrete and zones do not change during a game,
+        # memoize with half tile resolution
+        key = (int(position.x * 2), int(position.y * 2))
+        cached = self._adjust_cache.get(key)
+        if cached is not None:
+            return cached
+
         closest_zone: Optional[Point2] = None
         if self.pather:
             zone_index = self.pather.map.get_zone(position)
@@ -222,9 +343,14 @@ class GridBuilding(ActBuilding):
                 closest_zone = self.zone_manager.expansion_zones[zone_index - 1].center_location
 
         if closest_zone is None:
-            closest_zone = position.closest(map_to_point2s_center(self.zone_manager.expansion_zones))
+            if self._zone_centers is None:
+                # Expansion zones do not change during a game, list them only once
+                self._zone_centers = map_to_point2s_center(self.zone_manager.expansion_zones)
+            closest_zone = position.closest(self._zone_centers)
 
-        return position.towards(closest_zone, 1)
+        adjusted = position.towards(closest_zone, 1)
+        self._adjust_cache[key] = adjusted
+        return adjusted
 
     async def debug_actions(self):
         if self.builder_tag is not None:
@@ -252,69 +378,162 @@ class GridBuilding(ActBuilding):
             self.roles.clear_task(self.builder_tag)
             self.builder_tag = None
 
+    def _structure_blocker(self) -> Callable[[Point2], bool]:
+        """Returns a check for whether any structure blocks building to a position.
+
+        Queries the building solver's shared kd-tree instead of scanning all structures
+        for every candidate position."""
+        tree = self.building_solver.structure_tree()
+        if tree is None:
+            return lambda point: False
+        return lambda point: len(tree.query_ball_point((point.x, point.y), 1)) > 0
+
+    def _sliced_positions(self, positions: List[Point2], iterator: int) -> List[Point2]:
+        """Cached [::iterator] copies of a solver position list.
+
+        The solver positions are static once the grid is solved, so the stride copy does
+        not need to be reallocated on every placement scan."""
+        if iterator == 1:
+            return positions
+        cached = self._slice_cache.get(iterator)
+        if cached is None or self._slice_cache_source_len != len(positions):
+            self._slice_cache.clear()
+            cached = positions[::iterator]
+            self._slice_cache[iterator] = cached
+            self._slice_cache_source_len = len(positions)
+        return cached
+
+    def _blocked_mask(self, candidates: List[Point2], iterator: int) -> Optional[np.ndarray]:
+        """Structure blocking for a whole candidate list in one batched kd-tree query.
+
+        Returns a boolean array aligned with the candidates, or None when there are no
+        structures and nothing can be blocked."""
+        tree = self.building_solver.structure_tree()
+        if tree is None or not candidates:
+            return None
+        array = self._array_cache.get(iterator)
+        if array is None or self._array_cache_source_len != len(candidates):
+            self._array_cache.clear()
+            array = np.asarray(candidates, dtype=float)
+            self._array_cache[iterator] = array
+            self._array_cache_source_len = len(candidates)
+        distances, _ = tree.query(array)
+        return distances <= 1
+
+    def _forbidden_locations(self) -> Set[Point2]:
+        """Union of all forbidden 3x3 locations for terran placement.
+
+        Combines landing reservations, free addon spots and optionally the wall into a
+        single set, so the scan does one membership test per candidate instead of three.
+        Rebuilt at most once per iteration."""
+        iteration = self.knowledge.iteration
+        if self._forbidden_cached_iteration != iteration:
+            forbidden = set(self.building_solver.structure_target_move_location.values())
+            forbidden.update(self.building_solver.free_addon_locations)
+            if not self.allow_wall:
+                forbidden.update(self._wall3x3_lookup())
+            self._forbidden_cached = forbidden
+            self._forbidden_cached_iteration = iteration
+        return self._forbidden_cached
+
+    def _wall3x3_lookup(self) -> frozenset:
+        """Hashed view of the wall positions, the solver list would be scanned per candidate."""
+        if self._wall3x3_set is None:
+            self._wall3x3_set = frozenset(self.building_solver.wall3x3)
+        return self._wall3x3_set
+
+    @staticmethod
+    def _proximity_checker(units: Units, distance: float) -> Callable[[Point2], bool]:
+        """Returns a check for whether any of the units is within distance of a position.
+
+        Builds a kd-tree once for the whole scan, the linear scan alternative costs
+        O(len(units)) for every candidate position."""
+        if not units:
+            return lambda point: False
+        tree = cKDTree([(unit.position.x, unit.position.y) for unit in units])
+        return lambda point: len(tree.query_ball_point((point.x, point.y), distance)) > 0
+
+    @staticmethod
+    def _any_unit_within(units: Units, point: Point2, distance: float) -> bool:
+        """Early exit scan with squared distances, avoids the sqrt per unit in distance_to_closest."""
+        distance_squared = distance * distance
+        for unit in units:
+            position = unit.position
+            dx = position.x - point.x
+            dy = position.y - point.y
+            if dx * dx + dy * dy <= distance_squared:
+                return True
+        return False
+
     def position_protoss(self, count) -> Optional[Point2]:
         is_pylon = self.unit_type == UnitTypeId.PYLON
-        buildings = self.ai.structures
         matrix = self.ai.state.psionic_matrix
         future_position = None
 
         iterator = self.get_iterator(is_pylon, count)
+        source = self.building_solver.buildings2x2 if is_pylon else self.building_solver.buildings3x3
+        candidates = self._sliced_positions(source, iterator)
+        blocked_mask = self._blocked_mask(candidates, iterator)
 
         if is_pylon:
-            for point in self.building_solver.buildings2x2[::iterator]:
-                if not buildings.closer_than(1, point):
+            if blocked_mask is None:
+                return candidates[0] if candidates else None
+            for i, point in enumerate(candidates):
+                if not blocked_mask[i]:
                     return point
         else:
-            pylons = self.cache.own(UnitTypeId.PYLON).not_ready
-            for point in self.building_solver.buildings3x3[::iterator]:
-                if not self.allow_wall:
-                    if point in self.building_solver.wall3x3:
-                        continue
-                if not buildings.closer_than(1, point) and matrix.covers(point):
+            near_pending_pylon = self._proximity_checker(self.cache.own(UnitTypeId.PYLON).not_ready, 7)
+            wall3x3 = self._wall3x3_lookup() if not self.allow_wall else None
+            for i, point in enumerate(candidates):
+                if wall3x3 is not None and point in wall3x3:
+                    continue
+                if (blocked_mask is None or not blocked_mask[i]) and matrix.covers(point):
                     return point
 
-                if future_position is None and pylons and point.distance_to_closest(pylons) <= 7:
+                if future_position is None and near_pending_pylon(point):
                     future_position = point
 
         return future_position
 
     def position_zerg(self, count) -> Optional[Point2]:
-        buildings = self.ai.structures
+        blocked = self._structure_blocker()
         creep = self.ai.state.creep
         future_position = None
 
+        # Resolve the creep bitmap once for the whole scan instead of once per candidate
+        creep_data = getattr(creep, "data_numpy", None)
+        if creep_data is not None:
+            on_creep = lambda point: self._creep_area_set(creep_data, point)
+        else:
+            on_creep = lambda point: self.is_on_creep(creep, point)
+
         for point in self.building_solver.buildings3x3:
-            if not buildings.closer_than(1, point) and self.is_on_creep(creep, point):
+            if not blocked(point) and on_creep(point):
                 return point
 
         return future_position
 
     def position_terran(self, count) -> Optional[Point2]:
         is_depot = self.unit_type == UnitTypeId.SUPPLYDEPOT
-        buildings = self.ai.structures
+        blocked = self._structure_blocker()
         future_position = None
 
         if is_depot:
             for point in self.building_solver.buildings2x2:
-                if not buildings.closer_than(1, point):
+                if not blocked(point):
                     return point
         else:
-            pylons = self.cache.own(UnitTypeId.PYLON).not_ready
-            reserved_landing_locations: Set[Point2] = set(self.building_solver.structure_target_move_location.values())
+            near_pending_pylon = self._proximity_checker(self.cache.own(UnitTypeId.PYLON).not_ready, 7)
+            # Wall positions, AddonSwap() landing spots and locations with a free techlab
+            # or reactor next to them are all unavailable
+            forbidden_locations = self._forbidden_locations()
             for point in self.building_solver.buildings3x3:
-                if not self.allow_wall:
-                    if point in self.building_solver.wall3x3:
-                        continue
-                # If a structure is landing here from AddonSwap() then dont use this location
-                if point in reserved_landing_locations:
-                    continue
-                # If this location has a techlab or reactor next to it, then don't create a new structure here
-                if point in self.building_solver.free_addon_locations:
+                if point in forbidden_locations:
                     continue
-                if not buildings.closer_than(1, point):
+                if not blocked(point):
                     return point
 
-                if future_position is None and pylons and point.distance_to_closest(pylons) <= 7:
+                if future_position is None and near_pending_pylon(point):
                     future_position = point
 
         return future_position
@@ -345,7 +564,22 @@ class GridBuilding(ActBuilding):
         # TODO: Remake the error handling with frame delay
         worker.build(self.unit_type, position)
 
+    @staticmethod
+    def _creep_area_set(creep_data: np.ndarray, point: Point2) -> bool:
+        """Single C level reduction over the 5x5 creep area instead of 25 is_set calls."""
+        x_original = floor(point.x) - 1
+        y_original = floor(point.y) - 1
+        height, width = creep_data.shape
+        if x_original < 0 or y_original < 0 or x_original + 5 > width or y_original + 5 > height:
+            # Negative indices would wrap around and overflowing slices truncate silently,
+            # a 5x5 area partially off the map can never be fully on creep.
+            return False
+        return bool(creep_data[y_original : y_original + 5, x_original : x_original + 5].all())
+
     def is_on_creep(self, creep: PixelMap, point: Point2) -> bool:
+        creep_data = getattr(creep, "data_numpy", None)
+        if creep_data is not None:
+            return self._creep_area_set(creep_data, point)
         x_original = floor(point.x) - 1
         y_original = floor(point.y) - 1
         for x in range(x_original, x_original + 5):
@@ -356,50 +590,10 @@ class GridBuilding(ActBuilding):
 
     def prequisite_progress(self) -> float:
         """ Return progress in realtime seconds """
-        # Protoss:
-        if self.unit_type == UnitTypeId.GATEWAY or self.unit_type == UnitTypeId.FORGE:
-            return self.building_progress(UnitTypeId.PYLON)
-
-        if self.unit_type == UnitTypeId.CYBERNETICSCORE:
-            return min(self.building_progress(UnitTypeId.GATEWAY), self.building_progress(UnitTypeId.WARPGATE))
-
-        if self.unit_type == UnitTypeId.TWILIGHTCOUNCIL:
-            return self.building_progress(UnitTypeId.CYBERNETICSCORE)
-
-        if self.unit_type == UnitTypeId.TEMPLARARCHIVE:
-            return self.building_progress(UnitTypeId.TWILIGHTCOUNCIL)
-
-        if self.unit_type == UnitTypeId.DARKSHRINE:
-            return self.building_progress(UnitTypeId.TWILIGHTCOUNCIL)
-
-        if self.unit_type == UnitTypeId.STARGATE:
-            return self.building_progress(UnitTypeId.CYBERNETICSCORE)
-
-        if self.unit_type == UnitTypeId.FLEETBEACON:
-            return self.building_progress(UnitTypeId.STARGATE)
-
-        if self.unit_type == UnitTypeId.ROBOTICSFACILITY:
-            return self.building_progress(UnitTypeId.CYBERNETICSCORE)
-
-        if self.unit_type == UnitTypeId.ROBOTICSBAY:
-            return self.building_progress(UnitTypeId.ROBOTICSFACILITY)
-
-        if self.unit_type == UnitTypeId.PHOTONCANNON:
-            return self.building_progress(UnitTypeId.FORGE)
-
-        if self.unit_type == UnitTypeId.SHIELDBATTERY:
-            return self.building_progress(UnitTypeId.CYBERNETICSCORE)
-
-        # Terran:
-        if self.unit_type == UnitTypeId.BARRACKS:
-            return self.building_progress(UnitTypeId.SUPPLYDEPOT)
-        if self.unit_type == UnitTypeId.FACTORY:
-            return self.building_progress(UnitTypeId.BARRACKS)
-        if self.unit_type == UnitTypeId.ARMORY:
-            return self.building_progress(UnitTypeId.FACTORY)
-        if self.unit_type == UnitTypeId.STARPORT:
-            return self.building_progress(UnitTypeId.FACTORY)
-        if self.unit_type == UnitTypeId.FUSIONCORE:
-            return self.building_progress(UnitTypeId.STARPORT)
-
-        return 0
+        prerequisites = building_prerequisites.get(self.unit_type)
+        if prerequisites is None:
+            return 0
+        if len(prerequisites) == 1:
+            # Common case, skip the generator and min machinery
+            return self.building_progress(prerequisites[0])
+        return min(self.building_progress(prerequisite) for prerequisite in prerequisites)
@@ -1,28 +1,24 @@
-from math import ceil
-
-from sharpy.plans.acts import GridBuilding
+from sharpy.plans.acts.auto_supply import AutoSupply
 from sc2.ids.unit_typeid import UnitTypeId
 
 
-class AutoPylon(GridBuilding):
+class AutoPylon(AutoSupply):
     """Builds pylons automatically when needed based on predicted supply growth speed."""
 
     def __init__(self):
-        super().__init__(UnitTypeId.PYLON, 0)
-
-    async def execute(self):
-        self.to_count = await self.pylon_count_calc()
-        return await super().execute()
+        # Pylon build time is 18 seconds
+        super().__init__(UnitTypeId.PYLON, 18)
 
-    async def pylon_count_calc(self) -> int:
+    def growth_speed(self) -> float:
         growth_speed = 0
-        nexus_count = self.cache.own(UnitTypeId.NEXUS).ready.amount
+        own = self.cache.own  # Snapshot the bound method, this runs every iteration
+        nexus_count = own(UnitTypeId.NEXUS).ready.amount
 
-        gate_count = self.cache.own(UnitTypeId.GATEWAY).ready.amount
-        gate_count += self.cache.own(UnitTypeId.WARPGATE).ready.amount
+        gate_count = own(UnitTypeId.GATEWAY).ready.amount
+        gate_count += own(UnitTypeId.WARPGATE).ready.amount
 
-        robo_count = self.cache.own(UnitTypeId.ROBOTICSFACILITY).ready.amount
-        stargate_count = self.cache.own(UnitTypeId.STARGATE).ready.amount
+        robo_count = own(UnitTypeId.ROBOTICSFACILITY).ready.amount
+        stargate_count = own(UnitTypeId.STARGATE).ready.amount
 
         # Probes take 12 seconds to build
         # https://liquipedia.net/starcraft2/Nexus_(Legacy_of_the_Void)
@@ -40,14 +36,7 @@ class AutoPylon(GridBuilding):
         # fastest usage is tempest with 5 supply and build time of 43 seconds
         growth_speed += stargate_count * 5 / 43.0
 
-        growth_speed *= 1.2  # Just a little bit of margin of error
-        build_time = 18  # pylon build time
-        # build_time += min(self.ai.time / 60, 5) # probe walk time
-
-        predicted_supply = min(200, self.ai.supply_used + build_time * growth_speed)
-        current_pylons = self.cache.own(UnitTypeId.PYLON).ready.amount
-
-        if self.ai.supply_cap == 200:
-            return current_pylons
+        return growth_speed
 
-        return ceil((predicted_supply - self.ai.supply_cap) / 8) + current_pylons
+    def current_count(self) -> int:
+        return self.cache.own(UnitTypeId.PYLON).ready.amount
@@ -1,32 +1,28 @@
-from math import ceil
-
-from sharpy.plans.acts import GridBuilding
+from sharpy.plans.acts.auto_supply import AutoSupply
 from sc2.ids.unit_typeid import UnitTypeId
 
 
-class AutoDepot(GridBuilding):
-    """Builds pylons automatically when needed based on predicted supply growth speed."""
+class AutoDepot(AutoSupply):
+    """Builds depots automatically when needed based on predicted supply growth speed."""
 
     def __init__(self):
-        super().__init__(UnitTypeId.SUPPLYDEPOT, 0)
-
-    async def execute(self):
-        self.to_count = await self.pylon_count_calc()
-        return await super().execute()
+        # Depot build time is 21 seconds
+        super().__init__(UnitTypeId.SUPPLYDEPOT, 21)
 
-    async def pylon_count_calc(self) -> int:
+    def growth_speed(self) -> float:
         growth_speed = 0
-        townhall_count = self.cache.own(
+        own = self.cache.own  # Snapshot the bound method, this runs every iteration
+        townhall_count = own(
             {UnitTypeId.COMMANDCENTER, UnitTypeId.PLANETARYFORTRESS, UnitTypeId.ORBITALCOMMAND}
         ).ready.amount
 
-        rax_count = self.cache.own(UnitTypeId.BARRACKS).ready.amount
-        rax_count += self.cache.own(UnitTypeId.BARRACKSREACTOR).ready.amount
+        rax_count = own(UnitTypeId.BARRACKS).ready.amount
+        rax_count += own(UnitTypeId.BARRACKSREACTOR).ready.amount
 
-        factory_count = self.cache.own(UnitTypeId.FACTORY).ready.amount
-        factory_count += self.cache.own(UnitTypeId.FACTORYREACTOR).ready.amount
-        starport_count = self.cache.own(UnitTypeId.STARPORT).ready.amount
-        starport_count += self.cache.own(UnitTypeId.STARPORTREACTOR).ready.amount
+        factory_count = own(UnitTypeId.FACTORY).ready.amount
+        factory_count += own(UnitTypeId.FACTORYREACTOR).ready.amount
+        starport_count = own(UnitTypeId.STARPORT).ready.amount
+        starport_count += own(UnitTypeId.STARPORTREACTOR).ready.amount
 
         # Probes/scv take 12 seconds to build
         # https://liquipedia.net/starcraft2/Nexus_(Legacy_of_the_Void)
@@ -44,16 +40,9 @@ class AutoDepot(GridBuilding):
         # We'll ues viking timing here
         growth_speed += starport_count * 2 / 30.0
 
-        growth_speed *= 1.2  # Just a little bit of margin of error
-        build_time = 21  # depot build time
-        # build_time += min(self.ai.time / 60, 5) # probe walk time
+        return growth_speed
 
-        predicted_supply = min(200, self.ai.supply_used + build_time * growth_speed)
-        current_depots = self.cache.own(
+    def current_count(self) -> int:
+        return self.cache.own(
             {UnitTypeId.SUPPLYDEPOT, UnitTypeId.SUPPLYDEPOTLOWERED, UnitTypeId.SUPPLYDEPOTDROP}
         ).ready.amount
-
-        if self.ai.supply_cap == 200:
-            return current_depots
-
-        return ceil((predicted_supply - self.ai.supply_cap) / 8) + current_depots
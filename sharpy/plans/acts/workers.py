@@ -61,7 +61,6 @@ class Workers(ActBase):
         simultaneous_count = min(simultaneous_count, need_count_more)
 
         available_builders = builders.idle
-        busy_builders = builders.tags_not_in(available_builders.tags)
 
         supply_for = self.ai.supply_left
 
@@ -90,24 +89,30 @@ class Workers(ActBase):
                     simultaneous_count -= need_new_supply_for
 
         if self.reserve:
-            self.reserve_minerals(available_builders, busy_builders, income, simultaneous_count)
+            self.reserve_minerals(builders, available_builders, income, simultaneous_count)
 
         return False
 
-    def reserve_minerals(self, available_builders, busy_builders, income, simultaneous_count):
+    def reserve_minerals(self, builders, available_builders, income, simultaneous_count):
         if simultaneous_count > len(available_builders):
+            # Only filter the busy builders out when they actually need to be looked at
+            busy_builders = builders.tags_not_in(available_builders.tags)
             time_to_reserve = self.cost.minerals / income
             percentage_to_reserve = (12 - time_to_reserve) / 12
 
             # Let's check our income for busy builders
+            reserve_count = 0
             for builder in busy_builders:  # type: Unit
                 if builder.orders:
                     order: UnitOrder = builder.orders[0]
                     if order.ability.id == self.ability and order.progress > percentage_to_reserve:
-                        self.knowledge.reserve(self.cost.minerals, self.cost.vespene)
-                        simultaneous_count -= 1
-                        if simultaneous_count <= len(available_builders):
+                        reserve_count += 1
+                        if simultaneous_count - reserve_count <= len(available_builders):
                             break
+
+            if reserve_count:
+                # One aggregate reservation instead of a reserve call per builder
+                self.knowledge.reserve(self.cost.minerals * reserve_count, self.cost.vespene * reserve_count)
         for builder in available_builders:
             if not builder.is_flying:
                 if self.knowledge.cooldown_manager.is_ready(builder.tag, self.ability):
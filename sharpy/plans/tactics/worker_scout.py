@@ -1,5 +1,6 @@
 import sys
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional
 
 from sharpy.constants import Constants
 from sharpy.interfaces import IZoneManager
@@ -32,10 +33,10 @@ class WorkerScout(ActBase):
         # This is used for stuck / unreachable detection
         self.last_locations: List[Point2] = []
 
-        # An ordered list of locations to scout. Current target
-        # is first on the list, with descending priority, ie.
+        # An ordered queue of locations to scout. Current target
+        # is first in the queue, with descending priority, ie.
         # least important location is last.
-        self.scout_locations: List[Point2] = []
+        self.scout_locations: Deque[Point2] = deque()
 
     async def start(self, knowledge: Knowledge):
         await super().start(knowledge)
@@ -132,7 +133,7 @@ class WorkerScout(ActBase):
 
     def circle_location(self, location: Point2):
         self.scout_locations.clear()
-        self.scout_locations = points_on_circumference_sorted(location, self.scout.position, 10, 30)
+        self.scout_locations = deque(points_on_circumference_sorted(location, self.scout.position, 10, 30))
         self.print(f"Circling location {location}")
 
     def scout_enemy_expansions(self):
@@ -141,7 +142,7 @@ class WorkerScout(ActBase):
 
         self.scout_locations.clear()
 
-        self.scout_locations = map_to_point2s_minerals(self.zone_manager.enemy_expansion_zones[0:5])
+        self.scout_locations = deque(map_to_point2s_minerals(self.zone_manager.enemy_expansion_zones[0:5]))
         self.print(f"Scouting {len(self.scout_locations)} expansions from enemy base towards us")
 
     @property
@@ -177,7 +178,7 @@ class WorkerScout(ActBase):
 
     def target_location_reached(self):
         if len(self.scout_locations) > 0:
-            self.scout_locations.pop(0)
+            self.scout_locations.popleft()
 
     async def execute(self) -> bool:
         await self.scout_locations_upkeep()